@@ -0,0 +1,110 @@
+"""
+Per-frame allocation profiling for the Maze Runner game.
+
+Used by maze_game.py --profile-alloc: each level runs for a fixed number of
+frames under tracemalloc. After a few warm-up frames, the profiler records
+how much Python memory every frame allocates on top of what it started with
+(the frame's peak) and what is left over at the end of the frame.
+
+A few sample frames follow the measured ones. Each starts by clearing
+tracemalloc's traces, so the snapshot at its end holds only the blocks the
+frame allocated and still holds, grouped by source line. That shows where
+the per-frame allocations come from; blocks allocated and freed within the
+frame count toward the peak but are not in the breakdown.
+
+Only allocations made through Python's allocator are seen; pixel buffers
+that SDL allocates for Surfaces are not.
+"""
+import tracemalloc
+
+WARMUP_FRAMES = 30  # Frames per level before measuring, so caches and fonts settle
+SAMPLE_FRAMES = 4  # Frames per level after measuring whose allocations are broken down by line
+
+class AllocationProfiler:
+    """Collects per-frame allocation figures for each level"""
+    def __init__(self, frames, budget, top_lines=10):
+        self.frames = frames
+        self.budget = budget
+        self.top_lines = top_lines
+        self.results = []  # One dict per profiled level
+        tracemalloc.start()
+
+    def start_level(self, name):
+        self.level_name = name
+        self.frame_index = 0
+        self.peaks = []
+        self.growth = []
+        self.start_snapshot = None
+        self.end_snapshot = None
+        self.samples = []  # Snapshots holding what each sample frame allocated
+
+    def measuring(self):
+        return WARMUP_FRAMES <= self.frame_index < WARMUP_FRAMES + self.frames
+
+    def sampling(self):
+        return self.frame_index >= WARMUP_FRAMES + self.frames
+
+    def frame_start(self):
+        if self.frame_index == WARMUP_FRAMES:
+            self.start_snapshot = tracemalloc.take_snapshot()
+        elif self.frame_index == WARMUP_FRAMES + self.frames:
+            self.end_snapshot = tracemalloc.take_snapshot()
+        if self.sampling():
+            tracemalloc.clear_traces()
+        tracemalloc.reset_peak()
+        self.frame_memory = tracemalloc.get_traced_memory()[0]
+
+    def frame_end(self):
+        """Record the frame; returns True once the level has run all of its frames"""
+        if self.measuring():
+            current, peak = tracemalloc.get_traced_memory()
+            self.peaks.append(peak - self.frame_memory)
+            self.growth.append(current - self.frame_memory)
+        elif self.sampling():
+            self.samples.append(tracemalloc.take_snapshot())
+        self.frame_index += 1
+        return self.frame_index >= WARMUP_FRAMES + self.frames + SAMPLE_FRAMES
+
+    def finish_level(self):
+        """Summarize the level, with allocations and net growth per frame by source line"""
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        # Every trace in a sample snapshot was allocated during that frame
+        allocations = {}
+        for snapshot in self.samples:
+            for stat in snapshot.filter_traces(filters).statistics('lineno'):
+                size, count = allocations.get(stat.traceback[0], (0, 0))
+                allocations[stat.traceback[0]] = (size + stat.size, count + stat.count)
+        growth = self.end_snapshot.filter_traces(filters).compare_to(
+            self.start_snapshot.filter_traces(filters), 'lineno')
+        self.results.append({
+            "name": self.level_name,
+            "mean_peak": sum(self.peaks) / len(self.peaks),
+            "max_peak": max(self.peaks),
+            "mean_growth": sum(self.growth) / len(self.growth),
+            "allocations": sorted(allocations.items(), key=lambda item: -item[1][0])[:self.top_lines],
+            # Under a byte per frame is noise from the odd object that outlives its frame
+            "growth_lines": [line for line in growth if abs(line.size_diff) >= self.frames][:self.top_lines],
+        })
+
+    def over_budget(self):
+        """Levels whose steady-state allocation per frame is above the budget"""
+        return [result for result in self.results if result["mean_peak"] > self.budget]
+
+    def report(self):
+        for result in self.results:
+            print(f"{result['name']}: {result['mean_peak']:.0f} B/frame allocated on average "
+                  f"(max {result['max_peak']} B), {result['mean_growth']:+.1f} B/frame retained")
+            if result["allocations"]:
+                print("  Allocated per frame:")
+            for frame, (size, count) in result["allocations"]:
+                print(f"    {frame.filename}:{frame.lineno}: {size / SAMPLE_FRAMES:.0f} B/frame, "
+                      f"{count / SAMPLE_FRAMES:.1f} blocks/frame")
+            if result["growth_lines"]:
+                print("  Retained per frame:")
+            for line in result["growth_lines"]:
+                frame = line.traceback[0]
+                print(f"    {frame.filename}:{frame.lineno}: {line.size_diff / self.frames:+.1f} B/frame, "
+                      f"{line.count_diff / self.frames:+.2f} blocks/frame")
+        for result in self.over_budget():
+            print(f"FAIL {result['name']}: {result['mean_peak']:.0f} B/frame is over the "
+                  f"{self.budget} B/frame budget")
@@ -0,0 +1,196 @@
+"""
+Asset bake step for the Maze Runner game.
+
+Draws every sprite at every size the game uses, then packs them into atlases
+with a JSON manifest under assets/baked. Sprites with transparency go into
+atlas.png; opaque ones go into atlas_opaque.png, which has no alpha channel,
+so blitting them is a plain copy instead of per-pixel blending. At runtime
+the game loads the atlases and blits the sprites as they are, with no
+drawing or scaling.
+
+Each sprite job is keyed by a hash of its drawing code, size and the pygame
+version; jobs whose hash matches the manifest are skipped, and the others
+run in parallel worker processes. Run it after changing any drawing code:
+
+    python3 bake_assets.py
+"""
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pygame
+
+BAKED_DIR = os.path.join('assets', 'baked')
+MANIFEST_PATH = os.path.join(BAKED_DIR, 'manifest.json')
+ATLAS_FILE = 'atlas.png'
+OPAQUE_ATLAS_FILE = 'atlas_opaque.png'
+ATLAS_WIDTH = 256
+
+def draw_player(size):
+    """Green square with eyes"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(surface, (0, 200, 0), (0, 0, size[0], size[1]))
+    # Add eyes
+    eye_y = size[1] // 3
+    for eye_x in (size[0] // 3, 2 * size[0] // 3):
+        pygame.draw.circle(surface, (255, 255, 255), (eye_x, eye_y), size[0] // 6)
+        pygame.draw.circle(surface, (0, 0, 0), (eye_x, eye_y), size[0] // 15)
+    return surface
+
+def draw_wall(size):
+    """Blue brick pattern"""
+    surface = pygame.Surface(size)
+    surface.fill((50, 50, 150))  # Dark blue base
+    # Draw brick pattern
+    brick = size[0] // 4
+    for y in range(0, size[1], brick):
+        offset = 0 if y % (2 * brick) == 0 else brick
+        for x in range(offset, size[0], 2 * brick):
+            pygame.draw.rect(surface, (80, 80, 180), (x, y, brick, brick))
+    pygame.draw.rect(surface, (30, 30, 100), (0, 0, size[0], size[1]), 1)  # Border
+    return surface
+
+def draw_token(size):
+    """Gold coin"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    center = (size[0] // 2, size[1] // 2)
+    pygame.draw.circle(surface, (255, 215, 0), center, size[0] // 2)
+    pygame.draw.circle(surface, (200, 170, 0), center, size[0] // 2 - 2)
+    return surface
+
+def draw_obstacle(size):
+    """Red spiky ball"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    center = (size[0] // 2, size[1] // 2)
+    # Draw main circle
+    pygame.draw.circle(surface, (200, 0, 0), center, size[0] // 2)
+    # Draw spikes
+    for i in range(8):
+        spike = pygame.math.Vector2(1, 0).rotate(i * 45)
+        x = size[0] // 2 + int(size[0] // 2 * 0.8 * spike.x)
+        y = size[1] // 2 + int(size[1] // 2 * 0.8 * spike.y)
+        pygame.draw.line(surface, (255, 0, 0), center, (x, y), 3)
+    return surface
+
+def draw_heart(size):
+    """Red heart"""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    heart_color = (255, 0, 0)
+    # Draw two circles for the top of the heart
+    radius = size[0] // 4
+    pygame.draw.circle(surface, heart_color, (radius, radius), radius)
+    pygame.draw.circle(surface, heart_color, (size[0] - radius, radius), radius)
+    # Draw a triangle for the bottom of the heart
+    points = [
+        (0, radius),
+        (size[0] // 2, size[1]),
+        (size[0], radius)
+    ]
+    pygame.draw.polygon(surface, heart_color, points)
+    return surface
+
+# Every sprite at every size the game draws it (see the size constants in maze_game.py)
+SPRITES = {
+    'player': (draw_player, [(30, 30)]),
+    'wall': (draw_wall, [(40, 40)]),
+    'token': (draw_token, [(20, 20)]),
+    'obstacle': (draw_obstacle, [(25, 25)]),
+    'heart': (draw_heart, [(25, 25)]),
+}
+
+def sprite_key(name, size):
+    return f'{name}_{size[0]}x{size[1]}'
+
+def job_hash(name, size):
+    """Hash of everything that decides how a sprite comes out"""
+    draw = SPRITES[name][0]
+    source = json.dumps([name, list(size), inspect.getsource(draw), pygame.version.ver])
+    return hashlib.sha256(source.encode()).hexdigest()
+
+def bake_sprite(name, size):
+    """Draw one sprite and save it as a PNG (runs in a worker process)"""
+    surface = SPRITES[name][0](size)
+    pygame.image.save(surface, os.path.join(BAKED_DIR, sprite_key(name, size) + '.png'))
+    return name, size
+
+def pack_atlas(entries):
+    """Place sprites on shelves, tallest first, and return the atlas size"""
+    x = y = shelf_height = 0
+    for entry in sorted(entries, key=lambda entry: -entry['size'][1]):
+        width, height = entry['size']
+        if x + width > ATLAS_WIDTH:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        entry['rect'] = [x, y, width, height]
+        x += width
+        shelf_height = max(shelf_height, height)
+    return ATLAS_WIDTH, y + shelf_height
+
+def build_atlas(entries, filename, opaque):
+    width, height = pack_atlas(entries)
+    if opaque:
+        atlas = pygame.Surface((width, height))
+    else:
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        atlas.fill((0, 0, 0, 0))
+    for entry in entries:
+        sprite = pygame.image.load(os.path.join(BAKED_DIR, entry['file']))
+        # Adding onto transparent black copies alpha sprites exactly, alpha included
+        atlas.blit(sprite, entry['rect'][:2], special_flags=0 if opaque else pygame.BLEND_RGBA_ADD)
+        entry['atlas'] = filename
+    pygame.image.save(atlas, os.path.join(BAKED_DIR, filename))
+
+def build_atlases(entries):
+    """Pack sprites with an alpha channel and opaque sprites into separate atlases"""
+    groups = {ATLAS_FILE: [], OPAQUE_ATLAS_FILE: []}
+    for entry in entries:
+        sprite = pygame.image.load(os.path.join(BAKED_DIR, entry['file']))
+        opaque = not sprite.get_flags() & pygame.SRCALPHA
+        groups[OPAQUE_ATLAS_FILE if opaque else ATLAS_FILE].append(entry)
+    for filename, group in groups.items():
+        if group:
+            build_atlas(group, filename, filename == OPAQUE_ATLAS_FILE)
+    return [filename for filename, group in groups.items() if group]
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH) as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {"sprites": {}}
+
+def main():
+    os.makedirs(BAKED_DIR, exist_ok=True)
+    old_manifest = load_manifest()
+
+    entries = {}
+    stale = []
+    for name, (_, sizes) in SPRITES.items():
+        for size in sizes:
+            key = sprite_key(name, size)
+            entries[key] = {"name": name, "size": list(size), "file": key + '.png', "hash": job_hash(name, size)}
+            previous = old_manifest["sprites"].get(key, {})
+            if previous.get("hash") != entries[key]["hash"] or not os.path.exists(os.path.join(BAKED_DIR, key + '.png')):
+                stale.append((name, size))
+
+    # Draw the changed sprites in parallel
+    if stale:
+        with ProcessPoolExecutor() as pool:
+            for name, size in pool.map(bake_sprite, *zip(*stale)):
+                print(f"Baked {sprite_key(name, size)}")
+
+    atlas_hash = hashlib.sha256(''.join(sorted(entry["hash"] for entry in entries.values())).encode()).hexdigest()
+    atlases = old_manifest.get("atlases", [])
+    if (stale or old_manifest.get("hash") != atlas_hash or not atlases or
+            not all(os.path.exists(os.path.join(BAKED_DIR, filename)) for filename in atlases)):
+        atlases = build_atlases(list(entries.values()))
+        with open(MANIFEST_PATH, 'w') as manifest_file:
+            json.dump({"hash": atlas_hash, "atlases": atlases, "sprites": entries}, manifest_file, indent=2)
+        print(f"Wrote {', '.join(atlases)} and manifest with {len(entries)} sprites")
+    else:
+        print("All baked assets are up to date")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Frame capture for the Maze Runner game.
+
+Every captured frame is copied from the screen into one of a fixed number of
+reusable buffers and handed to a pool of worker threads that encode it as
+PNG. Encoding uses zlib, which releases the GIL, so the workers run alongside
+the game loop. When every buffer is waiting to be encoded, capture() blocks
+until one is free; that backpressure keeps memory bounded. If a worker fails
+to encode or write a frame, the error is raised from the next capture() or
+close() call.
+"""
+import os
+import queue
+import struct
+import threading
+import zlib
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+def png_chunk(kind, data):
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+def encode_png(rgb, width, height, compression=6):
+    """Encode tightly packed 8-bit RGB pixels as a PNG file"""
+    stride = width * 3
+    # Each scanline starts with filter type 0 (none)
+    scanlines = b''.join(b'\x00' + rgb[y * stride:(y + 1) * stride] for y in range(height))
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)  # 8-bit truecolor
+    return (PNG_SIGNATURE + png_chunk(b'IHDR', header) +
+            png_chunk(b'IDAT', zlib.compress(scanlines, compression)) + png_chunk(b'IEND', b''))
+
+class FrameCapture:
+    """Copies frames into pooled buffers and encodes them to numbered PNGs off the game thread"""
+    def __init__(self, directory, size, workers=4, depth=8, compression=6):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.width, self.height = size
+        self.compression = compression
+        self.frame_number = 0
+        self.buffers = queue.Queue()  # Free buffers; at most depth frames are in flight
+        self.jobs = queue.Queue()
+        self.buffer_size = None  # Allocated on the first frame, once the pixel format is known
+        self.depth = depth
+        self.error = None  # First exception raised by a worker
+        self.workers = [threading.Thread(target=self._encode_loop, name=f"capture-{i}", daemon=True)
+                        for i in range(workers)]
+        for worker in self.workers:
+            worker.start()
+
+    def capture(self, surface):
+        """Copy the surface's pixels into a free buffer and queue it for encoding"""
+        self._check_error()
+        bytesize = surface.get_bytesize()
+        if bytesize not in (3, 4):
+            raise ValueError("Frame capture needs a 24 or 32-bit surface")
+        # Byte offset of each color channel within a pixel (little-endian masks)
+        layout = (bytesize, surface.get_pitch(), [shift // 8 for shift in surface.get_shifts()[:3]])
+        
+        raw = surface.get_buffer()  # Locks the surface until released below
+        if self.buffer_size is None:
+            self.buffer_size = raw.length
+            for _ in range(self.depth):
+                self.buffers.put(bytearray(self.buffer_size))
+        buffer = self.buffers.get()  # Blocks while every buffer is still being encoded
+        buffer[:] = raw
+        del raw
+        
+        self.frame_number += 1
+        self.jobs.put((self.frame_number, buffer, layout))
+
+    def close(self):
+        """Wait for every queued frame to be written and stop the workers"""
+        for _ in self.workers:
+            self.jobs.put(None)
+        for worker in self.workers:
+            worker.join()
+        self._check_error()
+
+    def _check_error(self):
+        if self.error:
+            raise self.error
+
+    def _encode_loop(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            number, buffer, layout = job
+            try:
+                try:
+                    rgb = self._to_rgb(buffer, layout)
+                finally:
+                    self.buffers.put(buffer)  # The pixels are copied out, so the buffer can be reused
+                png = encode_png(rgb, self.width, self.height, self.compression)
+                with open(os.path.join(self.directory, f'frame_{number:06d}.png'), 'wb') as out:
+                    out.write(png)
+            except Exception as e:
+                # Keep consuming jobs so capture() never waits on a buffer that will not come back
+                if self.error is None:
+                    self.error = e
+
+    def _to_rgb(self, buffer, layout):
+        bytesize, pitch, offsets = layout
+        row_bytes = self.width * bytesize
+        if pitch != row_bytes:
+            buffer = b''.join(buffer[y * pitch:y * pitch + row_bytes] for y in range(self.height))
+        rgb = bytearray(self.width * self.height * 3)
+        for channel, offset in enumerate(offsets):
+            rgb[channel::3] = buffer[offset::bytesize]
+        return bytes(rgb)
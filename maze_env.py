@@ -0,0 +1,179 @@
+"""
+Batched environment for training agents on the Maze Runner levels.
+
+MazeEnv steps N independent games together with NumPy and never touches
+pygame: observations are grid tensors built straight from the maze arrays in
+levels.py and the entity positions.
+
+Movement is tile based. One step moves the player one tile, which takes about
+1/7.5 s in the game (5 px per 60 FPS frame on 40 px tiles), and obstacle speed
+and invulnerability are scaled to that same step length.
+
+Requires NumPy (pip install numpy); the game itself does not.
+"""
+import numpy as np
+from levels import LEVELS
+
+# Actions
+STAY, LEFT, RIGHT, UP, DOWN = range(5)
+ACTION_DELTAS = np.array([(0, 0), (0, -1), (0, 1), (-1, 0), (1, 0)])  # (row, col)
+DIRECTIONS = ACTION_DELTAS[1:]
+
+# Observation channels
+WALL_CHANNEL, TOKEN_CHANNEL, PLAYER_CHANNEL, OBSTACLE_CHANNEL = range(4)
+NUM_CHANNELS = 4
+
+# Rewards
+TOKEN_REWARD = 10
+LEVEL_REWARD = 10
+LIFE_LOST_REWARD = -10
+
+STARTING_LIVES = 3
+STEPS_PER_SECOND = 7.5  # Tiles per second the player covers in the game
+INVULNERABLE_STEPS = round(1.5 * STEPS_PER_SECOND)
+
+def obstacle_period(speed):
+    """Steps between obstacle moves for a level's obstacle_speed (pixels per 30 ms)"""
+    tiles_per_second = speed * (1000 / 30) / 40
+    return max(1, round(STEPS_PER_SECOND / tiles_per_second))
+
+class MazeEnv:
+    """N parallel games stepped together by a single step(actions) call.
+
+    Observations are a uint8 array of shape (num_envs, 4, rows, cols) holding
+    the wall, token, player and obstacle channels. The same array is updated in
+    place on every call, so copy it if you need to keep one. Games that finish
+    (level cleared, out of lives or max_steps reached) are reset automatically
+    and their slot already holds the new game's observation.
+    """
+    def __init__(self, num_envs, level=0, levels=LEVELS, max_steps=1000, seed=None):
+        shapes = {(len(data["maze"]), len(data["maze"][0])) for data in levels}
+        if len(shapes) != 1:
+            raise ValueError(f"All levels must share one maze size to be batched, got {sorted(shapes)}")
+
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+        self.rng = np.random.default_rng(seed)
+        self.level = np.broadcast_to(np.asarray(level, dtype=np.intp), (num_envs,)).copy()
+
+        # Per-level data, indexed by level number
+        grids = np.array([data["maze"] for data in levels])
+        self.walls = grids == 1
+        self.tokens = (grids == 3).astype(np.uint8)
+        self.token_counts = self.tokens.sum(axis=(1, 2))
+        self.starts = np.array([self._start(grid) for grid in grids])
+        self.empty_cells = [np.argwhere(grid != 1) for grid in grids]
+        self.spawn_points = [np.argwhere(grid == 4) for grid in grids]  # Row-major, like load_level
+        self.obstacle_counts = np.array([data.get("obstacle_count", 0) for data in levels])
+        self.periods = np.array([obstacle_period(data.get("obstacle_speed", 2)) for data in levels])
+
+        # Per-game state
+        rows, cols = grids.shape[1:]
+        self.max_obstacles = int(self.obstacle_counts.max())
+        self.obs = np.zeros((num_envs, NUM_CHANNELS, rows, cols), dtype=np.uint8)
+        self.player = np.zeros((num_envs, 2), dtype=np.intp)
+        self.obstacles = np.zeros((num_envs, self.max_obstacles, 2), dtype=np.intp)
+        self.directions = np.zeros((num_envs, self.max_obstacles, 2), dtype=np.intp)
+        self.obstacle_active = np.zeros((num_envs, self.max_obstacles), dtype=bool)
+        self.lives = np.zeros(num_envs, dtype=np.intp)
+        self.invulnerable = np.zeros(num_envs, dtype=np.intp)
+        self.tokens_left = np.zeros(num_envs, dtype=np.intp)
+        self.steps = np.zeros(num_envs, dtype=np.intp)
+        self.env_index = np.arange(num_envs)
+        self.obstacle_env = np.repeat(self.env_index, self.max_obstacles).reshape(num_envs, -1)
+        self.grid_max = np.array([rows - 1, cols - 1])
+
+    @staticmethod
+    def _start(grid):
+        """Player start tile, defaulting to (1, 1) like load_level"""
+        found = np.argwhere(grid == 2)
+        return found[0] if len(found) else np.array([1, 1])
+
+    def reset(self):
+        """Start a fresh game in every slot and return the observations"""
+        self._reset(self.env_index)
+        return self.obs
+
+    def _reset(self, envs):
+        levels = self.level[envs]
+        self.obs[envs, WALL_CHANNEL] = self.walls[levels]
+        self.obs[envs, TOKEN_CHANNEL] = self.tokens[levels]
+        self.obs[envs, PLAYER_CHANNEL] = 0
+        self.obs[envs, OBSTACLE_CHANNEL] = 0
+        self.player[envs] = self.starts[levels]
+        self.lives[envs] = STARTING_LIVES
+        self.invulnerable[envs] = 0
+        self.tokens_left[envs] = self.token_counts[levels]
+        self.steps[envs] = 0
+
+        # Spawn points first, then random empty tiles for any extra obstacles
+        for level in np.unique(levels):
+            group = envs[levels == level]
+            count = self.obstacle_counts[level]
+            cells = self.empty_cells[level]
+            picks = cells[self.rng.integers(len(cells), size=(len(group), self.max_obstacles))]
+            spawns = self.spawn_points[level][:count]
+            picks[:, :len(spawns)] = spawns
+            self.obstacles[group] = picks
+            self.obstacle_active[group] = np.arange(self.max_obstacles) < count
+        self.directions[envs] = DIRECTIONS[self.rng.integers(4, size=(len(envs), self.max_obstacles))]
+
+        self._mark(envs, 1)
+
+    def _mark(self, envs, value):
+        """Set (or clear) the player and obstacle channels at the current positions"""
+        self.obs[envs, PLAYER_CHANNEL, self.player[envs, 0], self.player[envs, 1]] = value
+        active = self.obstacle_active[envs]
+        positions = self.obstacles[envs][active]
+        self.obs[self.obstacle_env[envs][active], OBSTACLE_CHANNEL, positions[:, 0], positions[:, 1]] = value
+
+    def step(self, actions):
+        """Advance every game by one step.
+
+        actions holds one of STAY, LEFT, RIGHT, UP, DOWN per game. Returns
+        (observations, rewards, dones) as NumPy arrays.
+        """
+        envs = self.env_index
+        obs = self.obs
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        self._mark(envs, 0)
+
+        # Move the player unless a wall is in the way
+        target = np.clip(self.player + ACTION_DELTAS[actions], 0, self.grid_max)
+        free = ~self.walls[self.level, target[:, 0], target[:, 1]]
+        self.player[free] = target[free]
+
+        # Obstacles move on their level's period and turn sideways when they hit a wall
+        due = (self.steps % self.periods[self.level] == 0)[:, None] & self.obstacle_active
+        ahead = self.obstacles + self.directions
+        clipped = np.clip(ahead, 0, self.grid_max)
+        blocked = (ahead != clipped).any(axis=2) | self.walls[self.level[:, None], clipped[..., 0], clipped[..., 1]]
+        moving = due & ~blocked
+        self.obstacles[moving] = ahead[moving]
+        turning = due & blocked
+        sides = self.rng.choice((-1, 1), size=(int(turning.sum()), 1))
+        self.directions[turning] = self.directions[turning][:, ::-1] * sides
+
+        # Token pickup
+        rows, cols = self.player[:, 0], self.player[:, 1]
+        picked = obs[envs, TOKEN_CHANNEL, rows, cols].astype(bool)
+        obs[envs, TOKEN_CHANNEL, rows, cols] = 0
+        self.tokens_left -= picked
+        rewards += picked * TOKEN_REWARD
+
+        # Obstacle hits
+        touching = ((self.obstacles == self.player[:, None, :]).all(axis=2) & self.obstacle_active).any(axis=1)
+        hit = touching & (self.invulnerable == 0)
+        self.lives -= hit
+        self.invulnerable = np.where(hit, INVULNERABLE_STEPS, np.maximum(self.invulnerable - 1, 0))
+        rewards += hit * LIFE_LOST_REWARD
+
+        cleared = self.tokens_left == 0
+        rewards += cleared * LEVEL_REWARD
+
+        self.steps += 1
+        dones = cleared | (self.lives <= 0) | (self.steps >= self.max_steps)
+        self._mark(envs, 1)
+        if dones.any():
+            self._reset(np.flatnonzero(dones))
+        return obs, rewards, dones
@@ -1,10 +1,57 @@
+import argparse
 import pygame
 import sys
 import os
 import random
 import math
+import time
+import importlib
+import levels
 from levels import LEVELS
-from ui_elements import initialize_ui, load_image
+from score_history import ScoreHistory
+from alloc_profile import AllocationProfiler
+from frame_capture import FrameCapture
+import telemetry
+from route_solver import solve_route, par_time, next_token
+from timers import TimerWheel, SimulatedClock
+from ui_elements import initialize_ui, load_sprite, convert_sprite, MESSAGE_FONT
+
+# Command-line options
+parser = argparse.ArgumentParser(description="Q Maze Runner")
+parser.add_argument('--renderer', choices=['software', 'sdl2'], default='software',
+                    help="software: Surface blits (default); sdl2: SDL2 Renderer/Texture copies")
+parser.add_argument('--obstacle-mode', choices=['tick', 'event'], default='tick',
+                    help="tick: step and test walls every move (default); event: precompute wall hits")
+parser.add_argument('--idle', action='store_true',
+                    help="Only redraw the title and game-over screens after input or a state change")
+parser.add_argument('--dev', action='store_true',
+                    help="Watch levels.py and apply maze edits to the current level while playing")
+parser.add_argument('--hints', action='store_true',
+                    help="Show the par time and an arrow toward the next token on a short route")
+parser.add_argument('--telemetry', metavar='DIR',
+                    help="Log gameplay events and frame timings as binary records into DIR")
+parser.add_argument('--headless', action='store_true',
+                    help="Run with the SDL dummy video driver and skip the title screen")
+parser.add_argument('--frames', type=int, default=0,
+                    help="Quit after this many frames and print the average frame time")
+parser.add_argument('--seed', type=int,
+                    help="Seed the random number generator so a run (e.g. headless) repeats exactly")
+parser.add_argument('--capture', metavar='DIR',
+                    help="Save every frame of the run as a numbered PNG in DIR (encoded off the game thread)")
+parser.add_argument('--profile-alloc', type=int, default=0, metavar='FRAMES',
+                    help="Run FRAMES frames of every level headless under tracemalloc and report allocations")
+parser.add_argument('--alloc-budget', type=int, default=4096, metavar='BYTES',
+                    help="Fail --profile-alloc when a level allocates more than this per frame (default 4096)")
+args = parser.parse_args()
+
+if args.profile_alloc:
+    args.headless = True
+
+if args.seed is not None:
+    random.seed(args.seed)
+
+if args.headless:
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
 
 # Initialize pygame
 pygame.init()
@@ -28,22 +75,41 @@ RED = (255, 0, 0)
 GOLD = (255, 215, 0)
 LIGHT_BLUE = (100, 149, 237)  # For buttons
 
-# Create the screen
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption("Q Maze Runner")
+# Run history database (not written by headless runs)
+HISTORY_DB = 'scores.db'
+
+# Dev mode: how often levels.py is checked for changes
+LEVEL_WATCH_INTERVAL = 500  # milliseconds
+
 clock = pygame.time.Clock()
 
+# One scheduler and time source for every timer in the game.
+# Headless runs step simulated time by one 60 FPS frame per loop.
+time_source = SimulatedClock() if args.headless else pygame.time.get_ticks
+scheduler = TimerWheel(time_source)
+
 # Initialize UI elements
-message_system = initialize_ui()
+message_system = initialize_ui(scheduler)
+
+# Gameplay events go into a ring buffer that a background thread writes to DIR
+event_log = telemetry.Telemetry(args.telemetry) if args.telemetry else None
 
-# Load images
+# Captured frames are encoded to PNG by worker threads
+frame_capture = FrameCapture(args.capture, (SCREEN_WIDTH, SCREEN_HEIGHT)) if args.capture else None
+# The SDL2 backbuffer is read back into this one surface on every captured frame
+capture_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), 0, 32) if args.capture and args.renderer == 'sdl2' else None
+
+# Finished runs are queued here and written to disk by a background thread
+history = None if args.headless else ScoreHistory(HISTORY_DB)
+
+# Load images (baked to their final sizes by bake_assets.py)
 try:
     # Try to load images
-    player_img = load_image('player.png', (PLAYER_SIZE, PLAYER_SIZE))
-    wall_img = load_image('wall.png', (TILE_SIZE, TILE_SIZE))
-    token_img = load_image('token.png', (TOKEN_SIZE, TOKEN_SIZE))
-    obstacle_img = load_image('obstacle.png', (OBSTACLE_SIZE, OBSTACLE_SIZE))
-    heart_img = load_image('heart.png', (HEART_SIZE, HEART_SIZE))
+    player_img = load_sprite('player', (PLAYER_SIZE, PLAYER_SIZE))
+    wall_img = load_sprite('wall', (TILE_SIZE, TILE_SIZE))
+    token_img = load_sprite('token', (TOKEN_SIZE, TOKEN_SIZE))
+    obstacle_img = load_sprite('obstacle', (OBSTACLE_SIZE, OBSTACLE_SIZE))
+    heart_img = load_sprite('heart', (HEART_SIZE, HEART_SIZE))
     
     # Set flag for using images
     use_images = True
@@ -51,6 +117,30 @@ except Exception as e:
     print(f"Error loading images: {e}")
     use_images = False
 
+# Create the screen
+if args.renderer == 'sdl2' and not use_images:
+    print("The sdl2 renderer needs sprite images, falling back to software rendering")
+    args.renderer = 'software'
+
+if args.renderer == 'sdl2':
+    from sdl2_renderer import TextureCanvas
+    screen = TextureCanvas("Q Maze Runner", (SCREEN_WIDTH, SCREEN_HEIGHT))
+    # Sprites are uploaded once; every later blit of them is a texture copy
+    screen.upload(player_img, wall_img, token_img, obstacle_img, heart_img)
+    present = screen.present
+else:
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption("Q Maze Runner")
+    present = pygame.display.flip
+    if use_images:
+        # Sprites with transparency blend fastest in the display's pixel format
+        player_img, wall_img, token_img, obstacle_img, heart_img = map(
+            convert_sprite, (player_img, wall_img, token_img, obstacle_img, heart_img))
+
+# Hint arrow pointing right; rotated toward the next token when drawn
+hint_arrow_img = pygame.Surface((30, 16), pygame.SRCALPHA)
+pygame.draw.polygon(hint_arrow_img, GOLD, [(0, 5), (18, 5), (18, 0), (30, 8), (18, 16), (18, 11), (0, 11)])
+
 # Create fonts for title screen
 try:
     title_font = pygame.font.SysFont('Arial', 72, bold=True)
@@ -69,7 +159,6 @@ class Player:
         self.score = 0
         self.lives = 3  # Player starts with 3 lives
         self.invulnerable = False
-        self.invulnerable_timer = 0
         self.invulnerable_duration = 1.5  # seconds
         self.previous_lives = 3  # To track life changes
     
@@ -103,20 +192,20 @@ class Player:
                 if self.rect.colliderect(obstacle.rect):
                     self.lives -= 1
                     self.invulnerable = True
-                    self.invulnerable_timer = pygame.time.get_ticks()
+                    if event_log:
+                        event_log.record(telemetry.OBSTACLE_HIT, current_level_index + 1, self.lives)
+                    scheduler.schedule(self.invulnerable_duration * 1000, self.end_invulnerability)
                     # Show message
                     message_system.add_message("Ouch! Hit by an obstacle!", RED)
                     break
-        else:
-            # Check if invulnerability period is over
-            current_time = pygame.time.get_ticks()
-            if current_time - self.invulnerable_timer > self.invulnerable_duration * 1000:
-                self.invulnerable = False
+    
+    def end_invulnerability(self):
+        self.invulnerable = False
     
     def draw(self, surface):
         if use_images:
             # Flash when invulnerable
-            if self.invulnerable and pygame.time.get_ticks() % 300 < 150:
+            if self.invulnerable and scheduler.now() % 300 < 150:
                 # Create a semi-transparent white overlay
                 overlay = pygame.Surface((PLAYER_SIZE, PLAYER_SIZE), pygame.SRCALPHA)
                 overlay.fill((255, 255, 255, 128))
@@ -125,7 +214,7 @@ class Player:
             else:
                 surface.blit(player_img, self.rect)
         else:
-            if self.invulnerable and pygame.time.get_ticks() % 300 < 150:
+            if self.invulnerable and scheduler.now() % 300 < 150:
                 pygame.draw.rect(surface, WHITE, self.rect)
             else:
                 pygame.draw.rect(surface, self.color, self.rect)
@@ -188,17 +277,16 @@ class MovingObstacle:
         self.color = RED
         self.speed = speed
         self.direction = random.choice([(1, 0), (-1, 0), (0, 1), (0, -1)])
-        self.move_timer = 0
+        self.move_due = True
         self.move_delay = 30  # milliseconds between movement updates
+        # Event mode: free steps left before the next wall
+        self.free_steps = None
     
     def update(self, walls):
         # Only move every few milliseconds to control speed
-        current_time = pygame.time.get_ticks()
-        if current_time - self.move_timer < self.move_delay:
+        if not self.take_move():
             return
         
-        self.move_timer = current_time
-        
         # Store original position
         original_x = self.rect.x
         original_y = self.rect.y
@@ -222,18 +310,64 @@ class MovingObstacle:
         if collision:
             self.rect.x = original_x
             self.rect.y = original_y
-            
-            # Choose a new direction (not the same as current)
-            possible_directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-            possible_directions.remove(self.direction)
-            opposite_dir = (-self.direction[0], -self.direction[1])
-            if opposite_dir in possible_directions:
-                possible_directions.remove(opposite_dir)  # Avoid going back and forth
-            
-            if possible_directions:
-                self.direction = random.choice(possible_directions)
-            else:
-                self.direction = opposite_dir  # If no other options, go back
+            self.choose_new_direction()
+    
+    def allow_move(self):
+        self.move_due = True
+    
+    def take_move(self):
+        """Use up the move the timer allowed, if there is one, and arm the timer for the next"""
+        if not self.move_due:
+            return False
+        self.move_due = False
+        scheduler.schedule(self.move_delay, self.allow_move)
+        return True
+    
+    def choose_new_direction(self):
+        """Turn after hitting a wall"""
+        # Choose a new direction (not the same as current)
+        possible_directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        possible_directions.remove(self.direction)
+        opposite_dir = (-self.direction[0], -self.direction[1])
+        if opposite_dir in possible_directions:
+            possible_directions.remove(opposite_dir)  # Avoid going back and forth
+        
+        if possible_directions:
+            self.direction = random.choice(possible_directions)
+        else:
+            self.direction = opposite_dir  # If no other options, go back
+    
+    def free_distance(self, maze):
+        """Pixels the obstacle can travel in its direction before touching a wall or the edge"""
+        dx, dy = self.direction
+        rows, cols = len(maze), len(maze[0])
+        if dx:
+            # Rows the obstacle overlaps; a wall in any of them blocks the corridor
+            lanes = range(self.rect.top // TILE_SIZE, (self.rect.bottom - 1) // TILE_SIZE + 1)
+            col = (self.rect.right - 1) // TILE_SIZE + 1 if dx > 0 else self.rect.left // TILE_SIZE - 1
+            while 0 <= col < cols and all(maze[row][col] != 1 for row in lanes):
+                col += dx
+            if dx > 0:
+                return min(col * TILE_SIZE, SCREEN_WIDTH) - self.rect.right
+            return self.rect.left - max((col + 1) * TILE_SIZE, 0)
+        else:
+            lanes = range(self.rect.left // TILE_SIZE, (self.rect.right - 1) // TILE_SIZE + 1)
+            row = (self.rect.bottom - 1) // TILE_SIZE + 1 if dy > 0 else self.rect.top // TILE_SIZE - 1
+            while 0 <= row < rows and all(maze[row][col] != 1 for col in lanes):
+                row += dy
+            if dy > 0:
+                return min(row * TILE_SIZE, SCREEN_HEIGHT) - self.rect.bottom
+            return self.rect.top - max((row + 1) * TILE_SIZE, 0)
+    
+    def start_segment(self, maze):
+        """Start a straight run in the current direction, counting the steps before a wall"""
+        self.free_steps = self.free_distance(maze) // self.speed
+    
+    def step(self):
+        """Take one precomputed step along the current run"""
+        self.free_steps -= 1
+        self.rect.x += self.direction[0] * self.speed
+        self.rect.y += self.direction[1] * self.speed
     
     def draw(self, surface):
         if use_images:
@@ -241,6 +375,37 @@ class MovingObstacle:
         else:
             pygame.draw.rect(surface, self.color, self.rect)
 
+class ObstacleScheduler:
+    """Event-driven obstacle movement.
+    
+    When an obstacle picks a direction, the number of steps it can take before
+    hitting a wall is computed once from the maze grid. Every later step is a
+    counter decrement until that runs out and the obstacle turns, so walls are
+    only looked at once per turn instead of on every tick. Steps are paced by
+    the same move timer as tick mode, so both modes move obstacles identically.
+    """
+    def __init__(self, maze, obstacles):
+        self.maze = maze
+        self.obstacles = obstacles
+    
+    def update(self):
+        for obstacle in self.obstacles:
+            if not obstacle.take_move():
+                continue
+            if obstacle.free_steps is None:
+                obstacle.start_segment(self.maze)
+            if obstacle.free_steps:
+                obstacle.step()
+            else:
+                # This is the tick that would hit the wall: turn in place, like tick mode
+                obstacle.choose_new_direction()
+                obstacle.start_segment(self.maze)
+    
+    def restart(self):
+        """Forget every planned run so they are recomputed from where obstacles are now"""
+        for obstacle in self.obstacles:
+            obstacle.free_steps = None
+
 class Button:
     def __init__(self, x, y, width, height, text, color=LIGHT_BLUE, hover_color=BLUE):
         self.rect = pygame.Rect(x, y, width, height)
@@ -250,16 +415,29 @@ class Button:
         self.current_color = color
         self.text_color = WHITE
         self.font = button_font
+        # Pre-render both color states so draw() is a single blit on any backend
+        self.images = {
+            color: self.render(color),
+            hover_color: self.render(hover_color),
+        }
+        
+    def render(self, fill_color):
+        """Render the button face in the given fill color"""
+        image = pygame.Surface(self.rect.size)
+        local_rect = image.get_rect()
         
-    def draw(self, surface):
         # Draw button rectangle
-        pygame.draw.rect(surface, self.current_color, self.rect)
-        pygame.draw.rect(surface, WHITE, self.rect, 2)  # White border
+        pygame.draw.rect(image, fill_color, local_rect)
+        pygame.draw.rect(image, WHITE, local_rect, 2)  # White border
         
         # Draw text
         text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=local_rect.center)
+        image.blit(text_surface, text_rect)
+        return image
+        
+    def draw(self, surface):
+        surface.blit(self.images[self.current_color], self.rect)
         
     def is_hovered(self, pos):
         return self.rect.collidepoint(pos)
@@ -272,10 +450,12 @@ class Button:
 
 def load_level(level_data):
     """Load a level from the level data"""
-    maze = level_data["maze"]
+    # Keep our own copy so dev-mode reloads can diff against what was loaded
+    maze = [list(row) for row in level_data["maze"]]
     
     # Create game elements
     walls = []
+    wall_tiles = {}  # (col, row) -> Wall, for dev-mode reloads
     tokens = []
     player = None
     empty_spaces = []
@@ -296,6 +476,7 @@ def load_level(level_data):
                 wall = Wall(x, y, TILE_SIZE, TILE_SIZE)
                 wall.color = wall_color  # Set custom wall color
                 walls.append(wall)
+                wall_tiles[(col, row)] = wall
             elif maze[row][col] == 2:  # Player starting position
                 player = Player(x + (TILE_SIZE - PLAYER_SIZE) // 2, 
                                y + (TILE_SIZE - PLAYER_SIZE) // 2)
@@ -314,6 +495,7 @@ def load_level(level_data):
     
     # Create obstacles based on level settings
     obstacles = []
+    spawn_obstacles = {}  # (col, row) -> obstacle started at that spawn point, for dev-mode reloads
     obstacle_count = level_data.get("obstacle_count", 0)
     obstacle_speed = level_data.get("obstacle_speed", 2)
     
@@ -322,7 +504,9 @@ def load_level(level_data):
         # Use defined spawn points first
         for i in range(min(obstacle_count, len(obstacle_spawn_points))):
             x, y = obstacle_spawn_points[i]
-            obstacles.append(MovingObstacle(x, y, obstacle_speed))
+            obstacle = MovingObstacle(x, y, obstacle_speed)
+            obstacles.append(obstacle)
+            spawn_obstacles[(x // TILE_SIZE, y // TILE_SIZE)] = obstacle
         
         # If we need more obstacles than spawn points, use random empty spaces
         if obstacle_count > len(obstacle_spawn_points):
@@ -345,10 +529,167 @@ def load_level(level_data):
         "tokens": tokens,
         "obstacles": obstacles,
         "empty_spaces": empty_spaces,
+        "obstacle_events": ObstacleScheduler(maze, obstacles),
+        "maze": maze,
+        "route": solve_route(maze) if args.hints else None,  # Memoized per layout
+        "wall_tiles": wall_tiles,
+        "wall_color": wall_color,
+        "obstacle_speed": obstacle_speed,
+        "obstacle_count": obstacle_count,
+        "obstacle_spawn_points": obstacle_spawn_points,
+        "spawn_obstacles": spawn_obstacles,
         "name": level_data.get("name", "Unnamed Level"),
         "description": level_data.get("description", "")
     }
 
+def apply_maze_changes(level_data, new_maze):
+    """Rebuild only the tiles that differ between the loaded maze and new_maze.
+    
+    Walls, tokens, spawn points and the grid used for obstacle collisions are
+    updated in place; the player keeps its position, score and lives. Obstacles
+    are then matched to the spawn points the way load_level places them.
+    Returns the number of tiles that changed.
+    """
+    maze = level_data["maze"]
+    changed = []
+    for row, (old_row, new_row) in enumerate(zip(maze, new_maze)):
+        if old_row != new_row:  # Whole-row comparison skips unchanged rows quickly
+            changed.extend((col, row, old, new)
+                           for col, (old, new) in enumerate(zip(old_row, new_row)) if old != new)
+    if not changed:
+        return 0
+    
+    walls = level_data["walls"]
+    wall_tiles = level_data["wall_tiles"]
+    tokens = level_data["tokens"]
+    spawn_points = level_data["obstacle_spawn_points"]
+    empty_spaces = level_data["empty_spaces"]
+    token_tiles = {(token.rect.x // TILE_SIZE, token.rect.y // TILE_SIZE): token for token in tokens}
+    
+    for col, row, old, new in changed:
+        x = col * TILE_SIZE
+        y = row * TILE_SIZE
+        maze[row][col] = new
+        
+        # Take down what the old tile value put there
+        if old == 1:
+            walls.remove(wall_tiles.pop((col, row)))
+        else:
+            empty_spaces.remove((col, row))
+            if old == 3 and (col, row) in token_tiles:
+                tokens.remove(token_tiles[(col, row)])
+            elif old == 4:
+                spawn_points.remove((x, y))
+        
+        # Build what the new tile value asks for
+        if new == 1:
+            wall = Wall(x, y, TILE_SIZE, TILE_SIZE)
+            wall.color = level_data["wall_color"]
+            walls.append(wall)
+            wall_tiles[(col, row)] = wall
+        else:
+            empty_spaces.append((col, row))
+            if new == 3:
+                tokens.append(Token(x, y))
+            elif new == 4:
+                spawn_points.append((x, y))
+    
+    if any(4 in (old, new) for _, _, old, new in changed):
+        place_obstacles(level_data)
+    
+    # Event-driven obstacles planned their runs on the old grid
+    level_data["obstacle_events"].restart()
+    return len(changed)
+
+def place_obstacles(level_data):
+    """Give the first obstacle_count spawn points an obstacle and fill the rest of obstacle_count
+    with obstacles on random empty tiles, keeping the obstacles that still fit (dev mode)"""
+    obstacles = level_data["obstacles"]
+    spawn_obstacles = level_data["spawn_obstacles"]
+    obstacle_count = level_data["obstacle_count"]
+    # Spawn points are used in maze order, like load_level does
+    spawn_points = sorted(level_data["obstacle_spawn_points"], key=lambda point: (point[1], point[0]))
+    used_points = spawn_points[:obstacle_count]
+    used_tiles = {(x // TILE_SIZE, y // TILE_SIZE) for x, y in used_points}
+    
+    for tile in list(spawn_obstacles):
+        if tile not in used_tiles:
+            obstacles.remove(spawn_obstacles.pop(tile))
+    for x, y in used_points:
+        if (x // TILE_SIZE, y // TILE_SIZE) not in spawn_obstacles:
+            obstacle = MovingObstacle(x, y, level_data["obstacle_speed"])
+            obstacles.append(obstacle)
+            spawn_obstacles[(x // TILE_SIZE, y // TILE_SIZE)] = obstacle
+    
+    # Random obstacles make up the difference
+    spawned = {id(obstacle) for obstacle in spawn_obstacles.values()}
+    extras = [obstacle for obstacle in obstacles if id(obstacle) not in spawned]
+    for obstacle in extras[obstacle_count - len(spawn_obstacles):]:
+        obstacles.remove(obstacle)
+    empty_spaces = level_data["empty_spaces"]
+    while len(obstacles) < obstacle_count and empty_spaces:
+        col, row = random.choice(empty_spaces)
+        obstacles.append(MovingObstacle(col * TILE_SIZE, row * TILE_SIZE, level_data["obstacle_speed"]))
+
+def reload_levels():
+    """Re-import levels.py and patch the current level to match (dev mode)"""
+    global LEVELS
+    try:
+        importlib.reload(levels)
+    except Exception as e:
+        print(f"Could not reload levels: {e}")
+        return
+    LEVELS = levels.LEVELS
+    
+    if current_level_index >= len(LEVELS):
+        return
+    new_maze = LEVELS[current_level_index]["maze"]
+    maze = level_data["maze"]
+    if len(new_maze) != len(maze) or any(len(row) != len(maze[0]) for row in new_maze):
+        print("Level size changed; the new layout applies the next time the level is loaded")
+        return
+    
+    start = time.perf_counter()
+    count = apply_maze_changes(level_data, new_maze)
+    if count and args.hints:
+        level_data["route"] = solve_route(level_data["maze"])
+    if count:
+        print(f"Reloaded {level_name}: {count} tiles changed in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+def watch_levels():
+    """Check levels.py for changes, then check again after LEVEL_WATCH_INTERVAL"""
+    global levels_mtime
+    mtime = os.stat(levels.__file__).st_mtime_ns
+    if mtime != levels_mtime:
+        levels_mtime = mtime
+        reload_levels()
+    scheduler.schedule(LEVEL_WATCH_INTERVAL, watch_levels)
+
+def draw_hint_arrow(surface, start, tile):
+    """Draw the hint arrow next to start, pointing at the center of a tile"""
+    target_x = tile[0] * TILE_SIZE + TILE_SIZE // 2
+    target_y = tile[1] * TILE_SIZE + TILE_SIZE // 2
+    angle = math.atan2(target_y - start[1], target_x - start[0])
+    arrow = pygame.transform.rotate(hint_arrow_img, -math.degrees(angle))
+    # Sit the arrow just outside the player, on the side facing the token
+    center = (start[0] + math.cos(angle) * PLAYER_SIZE, start[1] + math.sin(angle) * PLAYER_SIZE)
+    surface.blit(arrow, arrow.get_rect(center=center))
+
+def get_events(idle, timeout=None):
+    """Return pending events; when idle, sleep in pygame.event.wait until one arrives.
+    
+    With a timeout in milliseconds, a NOEVENT comes back if nothing arrives by then.
+    """
+    if not idle or timeout == 0:
+        return pygame.event.get()
+    if timeout is None:
+        return [pygame.event.wait()] + pygame.event.get()
+    return [pygame.event.wait(timeout)] + pygame.event.get()
+
+def needs_redraw_for(events):
+    """Whether any of the events can change what is on screen (mouse motion is checked via hover)"""
+    return any(event.type not in (pygame.NOEVENT, pygame.MOUSEMOTION) for event in events)
+
 def show_title_screen():
     """Show the title screen with start button"""
     # Create start button
@@ -362,10 +703,17 @@ def show_title_screen():
         "Start Game"
     )
     
+    # Leaderboard is read once; it cannot change while the title is up
+    high_scores = history.top_scores() if history else []
+    
+    idle = args.idle and not args.headless
+    needs_redraw = True
     title_running = True
     while title_running:
-        # Handle events
-        for event in pygame.event.get():
+        # Handle events (in idle mode, sleep until one arrives once the screen is drawn)
+        events = get_events(idle and not needs_redraw)
+        needs_redraw = needs_redraw or needs_redraw_for(events)
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -384,7 +732,13 @@ def show_title_screen():
         
         # Update button hover states
         mouse_pos = pygame.mouse.get_pos()
+        previous_color = start_button.current_color
         start_button.update(mouse_pos)
+        if start_button.current_color != previous_color:
+            needs_redraw = True
+        
+        if idle and not needs_redraw:
+            continue
         
         # Draw title screen
         screen.fill(BLACK)
@@ -397,14 +751,28 @@ def show_title_screen():
         # Draw start button
         start_button.draw(screen)
         
+        # Draw high scores
+        for rank, (score, level_reached, _) in enumerate(high_scores, start=1):
+            entry = MESSAGE_FONT.render(f"#{rank}  {score} pts - Level {level_reached}", True, GOLD)
+            screen.blit(entry, entry.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 140 + (rank - 1) * 26)))
+        
         # Draw instructions
         instructions = button_font.render("Press ENTER to start or ESC to quit", True, WHITE)
         instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         screen.blit(instructions, instructions_rect)
         
         # Update display
-        pygame.display.flip()
-        clock.tick(60)
+        present()
+        needs_redraw = False
+        if not idle:
+            clock.tick(60)
+
+def wait(milliseconds):
+    """Pause the game, or just move simulated time forward when headless"""
+    if args.headless:
+        time_source.advance(milliseconds)
+    else:
+        pygame.time.delay(milliseconds)
 
 # Initialize game state
 current_level_index = 0
@@ -413,6 +781,7 @@ walls = level_data["walls"]
 player = level_data["player"]
 tokens = level_data["tokens"]
 obstacles = level_data["obstacles"]
+obstacle_events = level_data["obstacle_events"]
 empty_spaces = level_data["empty_spaces"]
 level_name = level_data["name"]
 level_description = level_data["description"]
@@ -421,18 +790,31 @@ level_description = level_data["description"]
 game_over = False
 level_complete = False
 
+# Clear time in seconds of each level finished in the current run
+run_level_times = []
+level_start_time = scheduler.now()
+
+def finish_run():
+    """Queue the run that just ended for the history database"""
+    if history:
+        level_reached = min(current_level_index, len(LEVELS) - 1) + 1
+        history.record_run(player.score, level_reached, player.lives, run_level_times)
+
 def next_level():
     """Load the next level"""
     global current_level_index, level_data, walls, player, tokens
-    global obstacles, empty_spaces, level_name, level_description, level_complete
+    global obstacles, obstacle_events, empty_spaces, level_name, level_description, level_complete
+    global level_start_time
     
     current_level_index += 1
     if current_level_index < len(LEVELS):
+        level_start_time = scheduler.now()
         level_data = load_level(LEVELS[current_level_index])
         walls = level_data["walls"]
         player = level_data["player"]
         tokens = level_data["tokens"]
         obstacles = level_data["obstacles"]
+        obstacle_events = level_data["obstacle_events"]
         empty_spaces = level_data["empty_spaces"]
         level_name = level_data["name"]
         level_description = level_data["description"]
@@ -442,14 +824,42 @@ def next_level():
         # No more levels, game is complete
         return False
 
+# Dev mode: pick up level edits without restarting
+if args.dev:
+    levels_mtime = os.stat(levels.__file__).st_mtime_ns
+    scheduler.schedule(LEVEL_WATCH_INTERVAL, watch_levels)
+
 # Show title screen first
-show_title_screen()
+if not args.headless:
+    show_title_screen()
 
 # Game loop
 running = True
+frame_count = 0
+loop_start = time.perf_counter()
+idle_mode = args.idle
+needs_redraw = True
+profiler = AllocationProfiler(args.profile_alloc, args.alloc_budget) if args.profile_alloc else None
+if profiler:
+    profiler.start_level(level_name)
 while running:
-    # Handle events
-    for event in pygame.event.get():
+    if profiler:
+        profiler.frame_start()
+    frame_start = time.perf_counter_ns()
+    
+    # Handle events (in idle mode the game-over screen sleeps until input or the next timer is due)
+    idle = idle_mode and game_over and not needs_redraw
+    if idle and args.headless:
+        # No input ever arrives headless: skip simulated time to the next timer, and stop when none is left
+        due = scheduler.next_due()
+        if due is None:
+            break
+        time_source.advance(due)
+        events = pygame.event.get()
+    else:
+        events = get_events(idle, scheduler.next_due() if idle else None)
+    needs_redraw = needs_redraw_for(events)
+    for event in events:
         if event.type == pygame.QUIT:
             running = False
         
@@ -472,6 +882,7 @@ while running:
                 current_level_index = -1
                 player.score = 0  # Reset score
                 player.lives = 3  # Reset lives
+                run_level_times = []
                 if next_level():
                     game_over = False
             elif event.key == pygame.K_n and level_complete:
@@ -480,6 +891,7 @@ while running:
                     # No more levels, game is complete
                     game_over = True
                     message_system.add_game_complete_message(player.score)
+                    finish_run()
         
         # Handle key releases
         if event.type == pygame.KEYUP:
@@ -492,14 +904,21 @@ while running:
             elif event.key == pygame.K_DOWN and player.velocity_y > 0:
                 player.velocity_y = 0
     
+    # Fire due timers (message expiry, invulnerability, obstacle movement) before anything
+    # checks them, so a move that comes due this frame is taken this frame
+    scheduler.update()
+    
     # Update game state if not game over or level complete
     if not game_over and not level_complete:
         # Update player
         player.update(walls, obstacles)
         
         # Update obstacles
-        for obstacle in obstacles:
-            obstacle.update(walls)
+        if args.obstacle_mode == 'event':
+            obstacle_events.update()
+        else:
+            for obstacle in obstacles:
+                obstacle.update(walls)
         
         # Check for token collection
         tokens_to_remove = []
@@ -507,6 +926,9 @@ while running:
             if player.rect.colliderect(token.rect):
                 tokens_to_remove.append(token)
                 player.score += 10
+                if event_log:
+                    event_log.record(telemetry.TOKEN_PICKUP, current_level_index + 1,
+                                     token.rect.x // TILE_SIZE, token.rect.y // TILE_SIZE)
         
         # Remove collected tokens
         for token in tokens_to_remove:
@@ -517,28 +939,38 @@ while running:
             game_over = True
             message_system.add_game_over_message()
             message_system.add_final_score_message(player.score)
+            finish_run()
         
         # Check if all tokens are collected
         if not tokens:
             # Add bonus points for completing the level
             player.score += 10
             message_system.add_message(f"Level Complete! +10 points", GREEN, 2.0, 'center')
+            run_level_times.append((scheduler.now() - level_start_time) / 1000)
+            if event_log:
+                event_log.record(telemetry.LEVEL_COMPLETE, current_level_index + 1,
+                                 player.score, scheduler.now() - level_start_time)
             
             # Show level complete message briefly before automatically advancing
             level_complete = True
-            pygame.display.flip()  # Update display to show the message
-            pygame.time.delay(2000)  # Wait 2 seconds
+            present()  # Update display to show the message
+            wait(2000)  # Wait 2 seconds
             
             # Automatically advance to next level
             if not next_level():
                 # No more levels, game is complete
                 game_over = True
                 message_system.add_game_complete_message(player.score)
+                finish_run()
             else:
                 level_complete = False  # Continue to the next level
     
-    # Update message system
-    message_system.update()
+    if message_system.changed:
+        message_system.changed = False
+        needs_redraw = True
+    # Nothing on the game-over screen changed, so keep the last frame
+    if idle_mode and game_over and not needs_redraw:
+        continue
     
     # Draw everything
     screen.fill(BLACK)
@@ -558,6 +990,13 @@ while running:
     # Draw player
     player.draw(screen)
     
+    # Draw the next-token hint
+    if args.hints and not game_over:
+        remaining = {(token.rect.x // TILE_SIZE, token.rect.y // TILE_SIZE) for token in tokens}
+        target = next_token(level_data["route"], remaining)
+        if target:
+            draw_hint_arrow(screen, player.rect.center, target)
+    
     # Draw UI elements
     from ui_elements import DEFAULT_FONT, TITLE_FONT, SCORE_FONT, MESSAGE_FONT
     
@@ -570,6 +1009,11 @@ while running:
     screen.blit(score_bg, (10, 10))
     screen.blit(score_text, (20, 15))  # Offset slightly for padding
     
+    # Draw par time for the level
+    if args.hints:
+        par_text = MESSAGE_FONT.render(f"Par: {par_time(level_data['route']):.1f}s", True, GOLD)
+        screen.blit(par_text, (20, 75))
+    
     # Draw level info
     level_text = DEFAULT_FONT.render(f"Level {current_level_index + 1}: {level_name}", True, WHITE)
     screen.blit(level_text, (SCREEN_WIDTH // 2 - level_text.get_width() // 2, 15))  # Center level text
@@ -587,6 +1031,8 @@ while running:
         
         # Add a message
         message_system.add_message("Life lost!", RED, 1.5, 'center')
+        # Player.update stops once the game is over, so mark the loss as handled here
+        player.previous_lives = player.lives
     
     # Draw level description
     desc_text = MESSAGE_FONT.render(level_description, True, WHITE)
@@ -639,12 +1085,52 @@ while running:
     controls_text = MESSAGE_FONT.render("Controls: Arrow Keys to move | ESC: Quit", True, WHITE)
     screen.blit(controls_text, (10, SCREEN_HEIGHT - 30))
     
+    # Capture the finished frame (the SDL2 backbuffer is not kept after present)
+    if frame_capture:
+        frame_capture.capture(screen.to_surface(capture_surface) if args.renderer == 'sdl2' else screen)
+    
     # Update the display
-    pygame.display.flip()
+    present()
+    
+    if event_log:
+        event_log.record(telemetry.FRAME, current_level_index + 1,
+                         frame_count, (time.perf_counter_ns() - frame_start) // 1000)
+    
+    # Cap the frame rate (uncapped when benchmarking headless)
+    clock.tick(0 if args.headless else 60)
+    
+    if args.headless:
+        time_source.advance(1000 / 60)
+    
+    frame_count += 1
+    if args.frames and frame_count >= args.frames:
+        running = False
     
-    # Cap the frame rate
-    clock.tick(60)
+    # Allocation profiling runs each level for a fixed number of frames
+    if profiler and profiler.frame_end():
+        profiler.finish_level()
+        if next_level():
+            game_over = False
+            profiler.start_level(level_name)
+        else:
+            running = False
+
+if args.frames:
+    elapsed = time.perf_counter() - loop_start
+    print(f"{args.renderer}: {frame_count} frames in {elapsed:.2f}s "
+          f"({elapsed / frame_count * 1000:.3f} ms/frame)")
+
+# Write any queued runs before quitting
+if history:
+    history.close()
+if event_log:
+    event_log.close()
+if frame_capture:
+    frame_capture.close()
+
+if profiler:
+    profiler.report()
 
 # Quit pygame
 pygame.quit()
-sys.exit()
+sys.exit(1 if profiler and profiler.over_budget() else 0)
@@ -0,0 +1,192 @@
+"""
+Token route solver for the Maze Runner game.
+
+Works out a short order in which to collect every token of a level, starting
+from the player start (cell 2). The result gives par times and the "next
+token" hint. Routes are memoized by a hash of the maze, so each layout is only
+solved once per run.
+
+Positions are (col, row) tiles, like empty_spaces in maze_game.py.
+"""
+import hashlib
+
+# Levels with up to this many tokens get an exact order; larger ones a heuristic
+EXACT_TOKEN_LIMIT = 11
+
+# The player covers 5 px per frame at 60 FPS on 40 px tiles
+SECONDS_PER_TILE = 40 / (5 * 60)
+
+_routes = {}  # level hash -> route
+
+def level_hash(maze):
+    """Stable hash of a maze layout"""
+    return hashlib.sha1(repr([list(row) for row in maze]).encode()).hexdigest()
+
+def find_points(maze):
+    """Player start and token tiles in row-major order"""
+    start = (1, 1)  # Same default as load_level
+    tokens = []
+    for row, cells in enumerate(maze):
+        for col, cell in enumerate(cells):
+            if cell == 2:
+                start = (col, row)
+            elif cell == 3:
+                tokens.append((col, row))
+    return start, tokens
+
+def distance_matrix(maze, points):
+    """Walking distance in tiles between every pair of points (None if unreachable).
+
+    One breadth-first search runs from all points at once: every tile carries
+    a bitmask of the points whose wave has reached it, so each step of the
+    search advances all of them together.
+    """
+    rows, cols = len(maze), len(maze[0])
+    open_tiles = [cell != 1 for cells in maze for cell in cells]
+    seen = [0] * (rows * cols)
+    point_index = {}
+    frontier = {}
+    distances = [[None] * len(points) for _ in points]
+
+    for i, (col, row) in enumerate(points):
+        tile = row * cols + col
+        point_index.setdefault(tile, []).append(i)
+        seen[tile] |= 1 << i
+        frontier[tile] = frontier.get(tile, 0) | (1 << i)
+        distances[i][i] = 0
+    # Points sharing a tile are zero apart
+    for same in point_index.values():
+        for i in same:
+            for j in same:
+                distances[i][j] = 0
+
+    depth = 0
+    while frontier:
+        depth += 1
+        reached = {}
+        for tile, mask in frontier.items():
+            col = tile % cols
+            for neighbour, valid in ((tile - cols, tile >= cols), (tile + cols, tile < (rows - 1) * cols),
+                                     (tile - 1, col > 0), (tile + 1, col < cols - 1)):
+                if not valid or not open_tiles[neighbour]:
+                    continue
+                new_bits = mask & ~seen[neighbour]
+                if new_bits:
+                    seen[neighbour] |= new_bits
+                    reached[neighbour] = reached.get(neighbour, 0) | new_bits
+
+        # Record the first time each wave arrives at another point
+        for tile, bits in reached.items():
+            for j in point_index.get(tile, ()):
+                while bits:
+                    low = bits & -bits
+                    i = low.bit_length() - 1
+                    distances[i][j] = distances[j][i] = depth
+                    bits ^= low
+        frontier = reached
+    return distances
+
+def exact_order(distances, targets):
+    """Shortest path from point 0 through all targets (Held-Karp dynamic programming)"""
+    count = len(targets)
+    full = (1 << count) - 1
+    # best[mask][j]: length of the shortest path from the start visiting mask and ending at targets[j]
+    best = [[None] * count for _ in range(1 << count)]
+    parent = [[None] * count for _ in range(1 << count)]
+    for j, target in enumerate(targets):
+        best[1 << j][j] = distances[0][target]
+
+    for mask in range(1, full + 1):
+        for j in range(count):
+            length = best[mask][j]
+            if length is None:
+                continue
+            for k in range(count):
+                if mask & (1 << k):
+                    continue
+                candidate = length + distances[targets[j]][targets[k]]
+                extended = mask | (1 << k)
+                if best[extended][k] is None or candidate < best[extended][k]:
+                    best[extended][k] = candidate
+                    parent[extended][k] = j
+
+    end = min(range(count), key=lambda j: best[full][j])
+    order = []
+    mask = full
+    while end is not None:
+        order.append(targets[end])
+        end, mask = parent[mask][end], mask & ~(1 << end)
+    return order[::-1]
+
+def path_length(distances, order):
+    previous = 0
+    total = 0
+    for point in order:
+        total += distances[previous][point]
+        previous = point
+    return total
+
+def heuristic_order(distances, targets):
+    """Nearest-neighbour path from the start, then improved with 2-opt segment reversals"""
+    order = []
+    remaining = set(targets)
+    current = 0
+    while remaining:
+        current = min(remaining, key=lambda point: distances[current][point])
+        order.append(current)
+        remaining.remove(current)
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(order) - 1):
+            before = order[i - 1] if i else 0
+            for j in range(i + 1, len(order)):
+                after = order[j + 1] if j + 1 < len(order) else None
+                # Reversing order[i..j] only changes the two edges at its ends
+                change = distances[before][order[j]] - distances[before][order[i]]
+                if after is not None:
+                    change += distances[order[i]][after] - distances[order[j]][after]
+                if change < 0:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    improved = True
+    return order
+
+def solve_route(maze):
+    """Find a short token collection order for a maze, memoized by level hash.
+
+    Returns a dict with the start tile, the token tiles in visiting order, the
+    route length in tiles and any tokens that cannot be reached from the start.
+    """
+    key = level_hash(maze)
+    if key in _routes:
+        return _routes[key]
+
+    start, tokens = find_points(maze)
+    points = [start] + tokens
+    distances = distance_matrix(maze, points)
+    targets = [i for i in range(1, len(points)) if distances[0][i] is not None]
+    if len(targets) <= EXACT_TOKEN_LIMIT:
+        order = exact_order(distances, targets) if targets else []
+    else:
+        order = heuristic_order(distances, targets)
+
+    route = {
+        "start": start,
+        "order": [points[i] for i in order],
+        "length": path_length(distances, order),
+        "unreachable": [points[i] for i in range(1, len(points)) if distances[0][i] is None],
+    }
+    _routes[key] = route
+    return route
+
+def par_time(route, seconds_per_tile=SECONDS_PER_TILE):
+    """Seconds needed to walk the route without stopping"""
+    return route["length"] * seconds_per_tile
+
+def next_token(route, remaining):
+    """First tile in the route order that is still in remaining, or None"""
+    for tile in route["order"]:
+        if tile in remaining:
+            return tile
+    return None
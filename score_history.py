@@ -0,0 +1,103 @@
+"""
+Persistent run history for the Maze Runner game.
+
+Finished runs are stored in a local SQLite database in WAL mode. The game
+loop only puts runs on a queue; a background thread writes everything that
+has queued up in one transaction, so the loop never waits on disk. If a
+write fails, the writer keeps going with later runs and close() raises the
+first error.
+"""
+import atexit
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    score INTEGER NOT NULL,
+    level_reached INTEGER NOT NULL,
+    lives INTEGER NOT NULL,
+    finished_at REAL NOT NULL
+);
+-- Leaderboard queries walk this index instead of sorting every run
+CREATE INDEX IF NOT EXISTS runs_by_score ON runs (score DESC, finished_at);
+CREATE TABLE IF NOT EXISTS level_clears (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    level INTEGER NOT NULL,
+    seconds REAL NOT NULL,
+    PRIMARY KEY (run_id, level)
+) WITHOUT ROWID;
+"""
+
+def connect(path):
+    """Open the database in WAL mode so the title screen can read while runs are written"""
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    return connection
+
+class ScoreHistory:
+    """Queues finished runs for a background writer and answers leaderboard queries"""
+    def __init__(self, path):
+        self.path = path
+        self.connection = connect(path)  # Reads happen on the game thread
+        self.connection.executescript(SCHEMA)
+        self.queue = queue.Queue()
+        self.error = None  # First exception raised by the writer thread
+        self.writer = threading.Thread(target=self._write_loop, name="score-history", daemon=True)
+        self.writer.start()
+        atexit.register(self.close)
+
+    def record_run(self, score, level_reached, lives, level_times):
+        """Queue a finished run; level_times holds the clear time in seconds of each level in order"""
+        self.queue.put((score, level_reached, lives, time.time(), list(level_times)))
+
+    def top_scores(self, limit=3):
+        """Best runs as (score, level_reached, finished_at) tuples, highest score first"""
+        return self.connection.execute(
+            "SELECT score, level_reached, finished_at FROM runs ORDER BY score DESC, finished_at LIMIT ?",
+            (limit,)).fetchall()
+
+    def close(self):
+        """Write anything still queued, stop the writer thread and raise the first failed write"""
+        atexit.unregister(self.close)
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+        self.connection.close()
+        if self.error:
+            raise self.error
+
+    def _write_loop(self):
+        connection = connect(self.path)  # SQLite connections stay on the thread that made them
+        running = True
+        while running:
+            # Wait for one run, then take whatever else queued up meanwhile
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            runs = [run for run in batch if run is not None]
+            if runs:
+                try:
+                    self._write(connection, runs)
+                except Exception as e:
+                    # Keep draining the queue so later runs are still written
+                    if self.error is None:
+                        self.error = e
+        connection.close()
+
+    def _write(self, connection, runs):
+        with connection:  # One transaction for the whole batch
+            for score, level_reached, lives, finished_at, level_times in runs:
+                run_id = connection.execute(
+                    "INSERT INTO runs (score, level_reached, lives, finished_at) VALUES (?, ?, ?, ?)",
+                    (score, level_reached, lives, finished_at)).lastrowid
+                connection.executemany(
+                    "INSERT INTO level_clears (run_id, level, seconds) VALUES (?, ?, ?)",
+                    [(run_id, level, seconds) for level, seconds in enumerate(level_times, start=1)])
@@ -0,0 +1,59 @@
+"""
+Optional SDL2 Renderer/Texture backend for the Maze Runner game.
+
+TextureCanvas stands in for the display surface returned by
+pygame.display.set_mode: the game keeps calling fill() and blit(), but
+sprites are uploaded to the renderer once and drawn as texture copies.
+The renderer is created without hardware acceleration so it runs on the
+SDL software renderer on machines without a GPU.
+"""
+import pygame
+from pygame._sdl2.video import Window, Renderer, Texture
+
+class TextureCanvas:
+    """Display target that draws through an SDL2 Renderer instead of Surface blits"""
+    def __init__(self, title, size):
+        self.window = Window(title, size=size)
+        self.renderer = Renderer(self.window, accelerated=0)
+        self.size = size
+        self.rect = pygame.Rect((0, 0), size)
+        self.textures = {}  # id(surface) -> Texture for sprites uploaded once
+
+    def upload(self, *surfaces):
+        """Upload sprite surfaces as textures so later blits are texture copies"""
+        for surface in surfaces:
+            self.textures[id(surface)] = Texture.from_surface(self.renderer, surface)
+
+    def get_size(self):
+        return self.size
+
+    def fill(self, color):
+        """Clear the whole frame to a solid color"""
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.clear()
+
+    def blit(self, source, dest):
+        """Copy a surface onto the frame at dest (a position or a rect's topleft)"""
+        rect = pygame.Rect(dest[:2], source.get_size())
+        texture = self.textures.get(id(source))
+        if texture is None:
+            # Text and overlays change every frame. SDL rounds alpha blending
+            # differently from pygame, so blend them with pygame's blitter onto
+            # the pixels already in the frame and copy the result back opaque.
+            area = rect.clip(self.rect)
+            if not area:
+                return
+            backdrop = self.renderer.to_surface(area=area)
+            backdrop.blit(source, (rect.x - area.x, rect.y - area.y))
+            texture = Texture.from_surface(self.renderer, backdrop)
+            texture.blend_mode = pygame.BLENDMODE_NONE
+            rect = area
+        texture.draw(dstrect=rect)
+
+    def present(self):
+        """Show the finished frame"""
+        self.renderer.present()
+
+    def to_surface(self, surface=None):
+        """Read the current frame back into a Surface, reusing surface when one is given"""
+        return self.renderer.to_surface(surface)
@@ -0,0 +1,174 @@
+"""
+Gameplay telemetry for the Maze Runner game.
+
+The game loop writes fixed-size binary event records into a preallocated
+ring buffer; a background thread flushes the buffer to rotating log files.
+If the buffer ever fills up, new events are dropped and counted rather than
+making the loop wait.
+
+Logs can be converted offline:
+
+    python telemetry.py telemetry/*.bin --csv events.csv
+"""
+import argparse
+import atexit
+import csv
+import functools
+import os
+import re
+import struct
+import threading
+import time
+
+# Event types
+TOKEN_PICKUP = 1    # a, b: token tile column and row
+OBSTACLE_HIT = 2    # a: lives left, b: unused
+LEVEL_COMPLETE = 3  # a: score, b: clear time in milliseconds
+FRAME = 4           # a: frame number, b: time spent on the frame in microseconds
+EVENT_NAMES = {TOKEN_PICKUP: "token_pickup", OBSTACLE_HIT: "obstacle_hit",
+               LEVEL_COMPLETE: "level_complete", FRAME: "frame"}
+
+# Record: timestamp in ns (perf_counter_ns), event type, level number, two event values
+RECORD = struct.Struct('<qHHii')
+RECORD_SIZE = RECORD.size
+RECORD_FIELDS = ('timestamp_ns', 'event', 'level', 'a', 'b')
+
+# Each log file starts with a magic number, format version and record size
+HEADER = struct.Struct('<4sHH')
+MAGIC = b'QMZT'
+VERSION = 1
+
+LOG_NAME = re.compile(r'telemetry-(\d+)\.bin')
+
+def last_log_number(directory):
+    """Highest number among the telemetry-NNNNN.bin files in directory, or 0 if there are none"""
+    matches = (LOG_NAME.fullmatch(name) for name in os.listdir(directory))
+    return max((int(match.group(1)) for match in matches if match), default=0)
+
+class Telemetry:
+    """Ring buffer of event records with a background flusher writing rotating log files"""
+    def __init__(self, directory, capacity=1 << 16, max_file_bytes=8 << 20, flush_interval=0.25):
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.buffer = bytearray(capacity * RECORD_SIZE)
+        self.head = 0  # Records written; only the game thread moves this
+        self.tail = 0  # Records flushed; only the flusher thread moves this
+        self.dropped = 0
+        self.max_file_bytes = max_file_bytes
+        self.flush_interval = flush_interval
+        self.file = None
+        self.file_index = last_log_number(directory)  # Counting files would reuse numbers after a deletion
+        self._write = functools.partial(RECORD.pack_into, self.buffer)
+        self.stopping = threading.Event()
+        self.flusher = threading.Thread(target=self._flush_loop, name="telemetry", daemon=True)
+        self.flusher.start()
+        atexit.register(self.close)
+
+    def record(self, event, level, a=0, b=0, timestamp=time.perf_counter_ns):
+        """Write one event into the ring buffer (called from the game loop)"""
+        head = self.head
+        mask = self.mask
+        if head - self.tail > mask:
+            self.dropped += 1
+            return
+        self._write((head & mask) * RECORD_SIZE, timestamp(), event, level, a, b)
+        self.head = head + 1
+
+    def close(self):
+        """Flush everything recorded so far and stop the flusher thread"""
+        if self.flusher.is_alive():
+            self.stopping.set()
+            self.flusher.join()
+
+    def _flush_loop(self):
+        while not self.stopping.wait(self.flush_interval):
+            self._flush()
+        self._flush()
+        if self.file:
+            self.file.close()
+        if self.dropped:
+            print(f"Telemetry dropped {self.dropped} events because the buffer was full")
+
+    def _flush(self):
+        head = self.head
+        tail = self.tail
+        if head == tail:
+            return
+        if self.file is None or self.file.tell() >= self.max_file_bytes:
+            self._rotate()
+        view = memoryview(self.buffer)
+        start = (tail & self.mask) * RECORD_SIZE
+        end = (head & self.mask) * RECORD_SIZE
+        if start < end:
+            self.file.write(view[start:end])
+        else:
+            # The pending records wrap around the end of the buffer
+            self.file.write(view[start:])
+            self.file.write(view[:end])
+        self.file.flush()
+        self.tail = head
+
+    def _rotate(self):
+        if self.file:
+            self.file.close()
+        while True:
+            self.file_index += 1
+            path = os.path.join(self.directory, f'telemetry-{self.file_index:05d}.bin')
+            try:
+                self.file = open(path, 'xb')  # Never truncate an existing log
+                break
+            except FileExistsError:
+                continue
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD_SIZE))
+
+def load_log(path):
+    """Read a log file and return its record bytes, checking the header"""
+    with open(path, 'rb') as log:
+        data = log.read()
+    magic, version, size = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION or size != RECORD_SIZE:
+        raise ValueError(f"{path} is not a version {VERSION} telemetry log")
+    # Ignore a partly written last record
+    usable = (len(data) - HEADER.size) // RECORD_SIZE * RECORD_SIZE
+    return data[HEADER.size:HEADER.size + usable]
+
+def read_records(path):
+    """Yield the records of one log file as tuples in RECORD_FIELDS order"""
+    yield from RECORD.iter_unpack(load_log(path))
+
+def to_csv(paths, output):
+    """Write the records of the given log files to a CSV file"""
+    with open(output, 'w', newline='') as out:
+        writer = csv.writer(out)
+        writer.writerow(RECORD_FIELDS[:1] + ('event_name',) + RECORD_FIELDS[1:])
+        for path in paths:
+            for record in read_records(path):
+                writer.writerow((record[0], EVENT_NAMES.get(record[1], record[1])) + record[1:])
+
+def to_numpy(paths):
+    """Load the given log files into one NumPy structured array (requires NumPy)"""
+    import numpy as np
+    dtype = np.dtype([('timestamp_ns', '<i8'), ('event', '<u2'), ('level', '<u2'), ('a', '<i4'), ('b', '<i4')])
+    arrays = [np.frombuffer(load_log(path), dtype=dtype) for path in paths]
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=dtype)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Convert Maze Runner telemetry logs")
+    parser.add_argument('logs', nargs='+', help="telemetry-*.bin files, oldest first")
+    parser.add_argument('--csv', help="Write the events to this CSV file")
+    parser.add_argument('--npy', help="Write the events to this .npy file (requires NumPy)")
+    args = parser.parse_args()
+    paths = sorted(args.logs)
+    if args.csv:
+        to_csv(paths, args.csv)
+    if args.npy:
+        import numpy as np
+        np.save(args.npy, to_numpy(paths))
+    if not args.csv and not args.npy:
+        for path in paths:
+            for record in read_records(path):
+                print(EVENT_NAMES.get(record[1], record[1]), *record)
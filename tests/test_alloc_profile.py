@@ -0,0 +1,53 @@
+"""
+Checks the per-frame allocation budget, both on the profiler itself and on the game.
+"""
+import os
+import subprocess
+import sys
+import tracemalloc
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+from alloc_profile import AllocationProfiler, SAMPLE_FRAMES
+
+def run_level(profiler, name, frame):
+    profiler.start_level(name)
+    done = False
+    while not done:
+        profiler.frame_start()
+        frame()
+        done = profiler.frame_end()
+    profiler.finish_level()
+
+def test_profiler_flags_the_level_over_budget_and_the_line_responsible():
+    kept = []
+    def allocating_frame():
+        kept[:] = [bytearray(8192)]  # Replaced every frame, like a freshly rendered Surface
+
+    profiler = AllocationProfiler(frames=20, budget=4096)
+    try:
+        run_level(profiler, "quiet", lambda: None)
+        run_level(profiler, "allocating", allocating_frame)
+    finally:
+        tracemalloc.stop()
+
+    assert [result["name"] for result in profiler.over_budget()] == ["allocating"]
+    frame, (size, count) = profiler.results[1]["allocations"][0]
+    assert frame.filename == __file__
+    assert size / SAMPLE_FRAMES >= 8192
+
+def run_game_profile(*extra):
+    return subprocess.run([sys.executable, 'maze_game.py', '--profile-alloc', '60', *extra],
+                          cwd=REPO, capture_output=True, text=True, timeout=300)
+
+def test_game_stays_within_allocation_budget():
+    result = run_game_profile()
+    assert result.returncode == 0, result.stdout
+    assert "FAIL" not in result.stdout
+
+def test_game_fails_a_budget_it_cannot_meet():
+    result = run_game_profile('--alloc-budget', '1')
+    assert result.returncode == 1
+    assert result.stdout.count("FAIL") == 3
+    assert "Allocated per frame:" in result.stdout
@@ -0,0 +1,45 @@
+"""
+Checks that frame capture writes readable PNGs and reports failed writes instead of hanging.
+"""
+import os
+import shutil
+import sys
+
+import pygame
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from frame_capture import FrameCapture
+
+def make_frame():
+    surface = pygame.Surface((16, 8), 0, 32)
+    surface.fill((10, 20, 30))
+    surface.set_at((3, 5), (200, 100, 50))
+    return surface
+
+def test_frames_are_written_as_pngs(tmp_path):
+    capture = FrameCapture(tmp_path, (16, 8), workers=2, depth=2)
+    frame = make_frame()
+    for _ in range(5):
+        capture.capture(frame)
+    capture.close()
+
+    assert sorted(os.listdir(tmp_path)) == [f'frame_{number:06d}.png' for number in range(1, 6)]
+    image = pygame.image.load(os.path.join(tmp_path, 'frame_000005.png'))
+    assert image.get_at((3, 5))[:3] == (200, 100, 50)
+    assert image.get_at((0, 0))[:3] == (10, 20, 30)
+
+def test_failed_writes_are_raised_from_capture(tmp_path):
+    directory = tmp_path / 'frames'
+    capture = FrameCapture(directory, (16, 8), workers=2, depth=2)
+    # Replace the output directory with a file so every write fails
+    shutil.rmtree(directory)
+    directory.write_text('')
+
+    frame = make_frame()
+    with pytest.raises(OSError):
+        for _ in range(100):
+            capture.capture(frame)
+    with pytest.raises(OSError):
+        capture.close()
@@ -0,0 +1,51 @@
+"""
+Checks that --idle lets the game-over screen sleep instead of redrawing every frame.
+"""
+import glob
+import os
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+import telemetry
+
+FRAME_LIMIT = 5000
+
+# One corridor with the player at the closed end and an obstacle spawn point,
+# so the obstacle keeps bouncing into the player until the game is over. The
+# token is walled off so the level cannot be completed.
+MAZE = [[1] * 20 for _ in range(15)]
+MAZE[1][1:5] = [2, 0, 0, 4]
+MAZE[3][3] = 3
+
+# Runs the game headless with a levels module holding only that maze
+DRIVER = f"""
+import runpy, sys, types
+levels = types.ModuleType('levels')
+levels.LEVELS = [{{"name": "Corridor", "description": "", "maze": {MAZE!r},
+                   "obstacle_count": 1, "obstacle_speed": 2}}]
+sys.modules['levels'] = levels
+sys.argv = ['maze_game.py'] + sys.argv[1:]
+runpy.run_path('maze_game.py', run_name='__main__')
+"""
+
+def test_game_over_screen_sleeps(tmp_path):
+    result = subprocess.run([sys.executable, '-c', DRIVER, '--headless', '--idle', '--seed', '1',
+                             '--frames', str(FRAME_LIMIT), '--telemetry', str(tmp_path)],
+                            cwd=REPO, capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+
+    records = [record for log in sorted(glob.glob(os.path.join(tmp_path, '*.bin')))
+               for record in telemetry.read_records(log)]
+    events = [event for _, event, _, lives, _ in records]
+    hits = [index for index, (_, event, _, lives, _) in enumerate(records)
+            if event == telemetry.OBSTACLE_HIT and lives == 0]
+    assert hits, "the last life was never lost"
+    # Headless idle runs stop by themselves once the game-over screen has no timers left
+    assert events.count(telemetry.FRAME) < FRAME_LIMIT
+    redraws = events[hits[0]:].count(telemetry.FRAME)
+    # The hit frame, the frame after it and one redraw per batch of messages expiring;
+    # a screen that never sleeps redraws every frame until the frame limit
+    assert 0 < redraws <= 6
@@ -0,0 +1,32 @@
+"""
+Checks that event-mode obstacles move exactly like tick-mode ones in a seeded headless game.
+"""
+import os
+import subprocess
+import sys
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FRAMES = 300
+
+def capture_run(directory, mode):
+    result = subprocess.run([sys.executable, 'maze_game.py', '--headless', '--seed', '3', '--frames', str(FRAMES),
+                             '--obstacle-mode', mode, '--capture', str(directory)],
+                            cwd=REPO, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stderr
+    names = sorted(os.listdir(directory))
+    assert len(names) == FRAMES
+    frames = []
+    for name in names:
+        with open(os.path.join(directory, name), 'rb') as frame_file:
+            frames.append(frame_file.read())
+    return frames
+
+def test_event_mode_draws_the_same_obstacle_rects_as_tick_mode(tmp_path):
+    tick_frames = capture_run(tmp_path / 'tick', 'tick')
+    event_frames = capture_run(tmp_path / 'event', 'event')
+
+    # The player stands still, so the frames change as the obstacles move and show each one's rect
+    assert len(set(tick_frames)) > FRAMES // 4
+    mismatches = [number for number, (tick, event) in enumerate(zip(tick_frames, event_frames), 1) if tick != event]
+    assert mismatches == []
@@ -0,0 +1,33 @@
+"""
+Checks that run history keeps writing after a failed write and reports the failure from close().
+"""
+import os
+import sqlite3
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from score_history import ScoreHistory
+
+def wait_for_error(history):
+    deadline = time.monotonic() + 10
+    while history.error is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+def test_failed_write_is_raised_from_close_and_later_runs_are_kept(tmp_path):
+    path = str(tmp_path / 'scores.db')
+    history = ScoreHistory(path)
+    history.record_run(20, 1, 2, [object()])  # Not a value SQLite can store
+    wait_for_error(history)
+    history.record_run(30, 2, 1, [9.0, 14.0])
+    with pytest.raises(sqlite3.Error):
+        history.close()
+
+    history = ScoreHistory(path)
+    try:
+        assert [(score, level) for score, level, _ in history.top_scores()] == [(30, 2)]
+    finally:
+        history.close()
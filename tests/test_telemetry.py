@@ -0,0 +1,26 @@
+"""
+Checks that telemetry logs survive new runs and convert back to the recorded events.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import telemetry
+
+def write_run(directory, frame_number):
+    log = telemetry.Telemetry(directory)
+    log.record(telemetry.FRAME, 1, frame_number, 0)
+    log.close()
+
+def test_new_run_does_not_overwrite_logs_after_a_deletion(tmp_path):
+    for frame_number in range(1, 4):
+        write_run(tmp_path, frame_number)
+    os.remove(tmp_path / 'telemetry-00001.bin')
+
+    write_run(tmp_path, 4)
+
+    logs = sorted(os.listdir(tmp_path))
+    assert logs == ['telemetry-00002.bin', 'telemetry-00003.bin', 'telemetry-00004.bin']
+    frames = [record[3] for log in logs for record in telemetry.read_records(tmp_path / log)]
+    assert frames == [2, 3, 4]
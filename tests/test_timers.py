@@ -0,0 +1,112 @@
+"""
+Checks that timer wheel timers fire on the first update that reaches their time, never early and never twice.
+"""
+import itertools
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from timers import TimerWheel, SimulatedClock, SLOTS, MAX_SPAN
+
+# Either side of each wheel level boundary, plus delays past the top level
+DELAYS = [0, 1, SLOTS - 1, SLOTS, SLOTS + 1, SLOTS ** 2 - 1, SLOTS ** 2, SLOTS ** 2 + 1,
+          SLOTS ** 3 - 1, SLOTS ** 3, MAX_SPAN - 1, MAX_SPAN, MAX_SPAN + 1, 3 * MAX_SPAN + 12345]
+
+def make_wheel(start):
+    clock = SimulatedClock(start)
+    return clock, TimerWheel(clock)
+
+def test_boundary_delays_fire_at_their_time():
+    for start in (0, 1, SLOTS - 1, SLOTS ** 2 + 5, MAX_SPAN - 3):
+        for delay in DELAYS:
+            clock, wheel = make_wheel(start)
+            fired = []
+            wheel.schedule(delay, lambda: fired.append(clock()))
+            due = start + max(delay, 1)
+            clock.time = due - 1
+            wheel.update()
+            assert fired == [], (start, delay)
+            clock.advance(1)
+            wheel.update()
+            assert fired == [due], (start, delay)
+            clock.advance(MAX_SPAN)
+            wheel.update()
+            assert fired == [due], (start, delay)
+
+def test_boundary_delays_fire_at_their_time_with_millisecond_updates():
+    for delay in (SLOTS - 1, SLOTS, SLOTS ** 2 - 1, SLOTS ** 2):
+        clock, wheel = make_wheel(7)
+        fired = []
+        wheel.schedule(delay, lambda: fired.append(clock()))
+        for _ in range(delay + SLOTS):
+            clock.advance(1)
+            wheel.update()
+        assert fired == [7 + delay], delay
+
+def test_random_timers_and_clock_jumps():
+    rng = random.Random(12)
+    clock, wheel = make_wheel(rng.randrange(MAX_SPAN))
+    pending = {}
+    fired = []
+    numbers = itertools.count()
+
+    def schedule():
+        delay = rng.choice([rng.randrange(SLOTS * 2), rng.randrange(SLOTS ** 3), rng.randrange(3 * MAX_SPAN)])
+        number = next(numbers)
+        pending[number] = (clock() + max(delay, 1), wheel.schedule(delay, lambda: fired.append((number, clock()))))
+
+    for _ in range(300):
+        schedule()
+    for _ in range(2000):
+        # Mostly frame-sized steps, with the occasional jump of minutes or hours
+        clock.advance(rng.choice([1, 16, 17, rng.randrange(SLOTS ** 2), rng.randrange(2 * MAX_SPAN)]))
+        fired.clear()
+        wheel.update()
+        for number, fired_at in fired:
+            due, _ = pending.pop(number)
+            assert due <= fired_at == clock()
+        # Anything still pending must not be due yet
+        assert all(due > clock() for due, _ in pending.values())
+        for _ in range(rng.randrange(3)):
+            schedule()
+
+def test_cancelled_timers_never_fire():
+    clock, wheel = make_wheel(0)
+    fired = []
+    for delay in DELAYS:
+        wheel.schedule(delay, lambda: fired.append(delay)).cancel()
+    clock.advance(4 * MAX_SPAN)
+    wheel.update()
+    assert fired == []
+
+def test_timer_scheduled_by_a_callback_waits_for_its_own_time():
+    clock, wheel = make_wheel(100)
+    fired = []
+
+    def tick():
+        fired.append(clock())
+        wheel.schedule(30, tick)
+
+    wheel.schedule(30, tick)
+    for _ in range(60):
+        clock.advance(1000 / 60)
+        wheel.update()
+    assert fired == sorted(set(fired))
+    assert all(later - earlier >= 30 for earlier, later in zip(fired, fired[1:]))
+
+def test_next_due_counts_down_to_the_earliest_pending_timer():
+    clock, wheel = make_wheel(50)
+    assert wheel.next_due() is None
+    wheel.schedule(5000, lambda: None)
+    first = wheel.schedule(1500, lambda: None)
+    assert wheel.next_due() == 1500
+    clock.advance(1000)
+    wheel.update()
+    assert wheel.next_due() == 500
+    first.cancel()
+    assert wheel.next_due() == 4000
+    clock.advance(MAX_SPAN)
+    wheel.update()
+    assert wheel.next_due() is None
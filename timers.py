@@ -0,0 +1,132 @@
+"""
+Timer scheduling for the Maze Runner game.
+
+Everything that waits on time (invulnerability, obstacle movement, message
+expiry) registers a timer on one TimerWheel instead of polling a clock each
+frame. The wheel reads a single injectable clock in milliseconds, so headless
+runs can drive it with a SimulatedClock.
+"""
+import pygame
+
+SLOT_BITS = 6
+SLOTS = 1 << SLOT_BITS  # Slots per wheel level
+SLOT_MASK = SLOTS - 1
+LEVELS = 4  # Four levels of 64 slots cover 2**24 ms (about 4.6 hours)
+MAX_SPAN = 1 << (SLOT_BITS * LEVELS)
+
+class Timer:
+    """A scheduled callback; cancelled timers are skipped when their slot comes up"""
+    __slots__ = ('expires', 'callback', 'active')
+
+    def __init__(self, expires, callback):
+        self.expires = expires
+        self.callback = callback
+        self.active = True
+
+    def cancel(self):
+        self.active = False
+
+class SimulatedClock:
+    """Clock that only moves when stepped, for headless runs"""
+    def __init__(self, start=0):
+        self.time = start
+
+    def __call__(self):
+        return int(self.time)
+
+    def advance(self, milliseconds):
+        self.time += milliseconds
+
+class TimerWheel:
+    """Hierarchical timer wheel with millisecond ticks.
+
+    Scheduling and cancelling are O(1); each timer is moved down a level at most
+    LEVELS - 1 times before it fires, so firing is amortized O(1) as well.
+    """
+    def __init__(self, clock=pygame.time.get_ticks):
+        self.clock = clock
+        self.current = clock()  # Last tick that has been processed
+        self.wheels = [[[] for _ in range(SLOTS)] for _ in range(LEVELS)]
+        self.counts = [0] * LEVELS  # Timers held per level, so empty stretches can be skipped
+
+    def now(self):
+        """Current time in milliseconds from the wheel's clock"""
+        return self.clock()
+
+    def schedule(self, delay, callback):
+        """Call callback once delay milliseconds from now and return its Timer"""
+        timer = Timer(self.clock() + int(delay), callback)
+        # The current tick has already been processed, so anything due fires on the next one
+        self._insert(timer, self.current + 1)
+        return timer
+
+    def next_due(self):
+        """Milliseconds until the next pending timer fires, or None if nothing is scheduled.
+        
+        This looks at every slot, so it is meant for deciding how long an idle screen
+        can sleep rather than for calling every frame.
+        """
+        expires = min((timer.expires for wheel in self.wheels for slot in wheel for timer in slot if timer.active),
+                      default=None)
+        if expires is None:
+            return None
+        # Nothing fires before the tick after the last processed one
+        return max(max(expires, self.current + 1) - self.clock(), 0)
+
+    def _insert(self, timer, earliest):
+        expires = max(timer.expires, earliest)
+        delta = min(expires - self.current, MAX_SPAN - 1)
+        level = 0
+        while delta >= SLOTS << (SLOT_BITS * level):
+            level += 1
+        if delta == MAX_SPAN - 1:
+            # Too far out for the top level: park it there and re-sort when it cascades
+            expires = self.current + delta
+        slot = (expires >> (SLOT_BITS * level)) & SLOT_MASK
+        self.wheels[level][slot].append(timer)
+        self.counts[level] += 1
+
+    def _cascade(self, level):
+        """Move the timers in the current slot of a level down to finer levels"""
+        slot = (self.current >> (SLOT_BITS * level)) & SLOT_MASK
+        timers = self.wheels[level][slot]
+        self.wheels[level][slot] = []
+        self.counts[level] -= len(timers)
+        for timer in timers:
+            if timer.active:
+                # Cascading runs before the current tick fires, so it may still land there
+                self._insert(timer, self.current)
+
+    def update(self):
+        """Fire every timer that has expired by the clock's current time"""
+        target = self.clock()
+        while self.current < target:
+            # Jump to just before the next boundary of the finest level that holds timers
+            level = 0
+            while level < LEVELS and not self.counts[level]:
+                level += 1
+            if level == LEVELS:
+                self.current = target
+                break
+            if level:
+                shift = SLOT_BITS * level
+                self.current = min(target - 1, max(self.current, (((self.current >> shift) + 1) << shift) - 1))
+
+            self.current += 1
+            # When a level wraps around, pull the next slot of the level above down
+            level = 1
+            while level < LEVELS and (self.current & ((1 << (SLOT_BITS * level)) - 1)) == 0:
+                level += 1
+            for upper in range(level - 1, 0, -1):
+                self._cascade(upper)
+
+            slot = self.current & SLOT_MASK
+            timers = self.wheels[0][slot]
+            if not timers:
+                continue
+            self.wheels[0][slot] = []
+            self.counts[0] -= len(timers)
+            for timer in timers:
+                if timer.active:
+                    timer.active = False
+                    timer.callback()
@@ -1,9 +1,9 @@
 """
 UI elements for the Maze Runner game.
 """
+import json
 import pygame
 import os
-import time
 
 # Initialize pygame font
 pygame.font.init()
@@ -14,6 +14,8 @@ TITLE_FONT = pygame.font.SysFont('Arial', 48)
 MESSAGE_FONT = pygame.font.SysFont('Arial', 24)
 SCORE_FONT = pygame.font.SysFont('Arial', 42, bold=True)  # Larger, bold font for score
 
+BAKED_DIR = os.path.join('assets', 'baked')
+
 def load_image(filename, size=None):
     """Load an image and optionally resize it"""
     try:
@@ -29,20 +31,62 @@ def load_image(filename, size=None):
         surface.fill((255, 0, 255))  # Magenta for missing textures
         return surface
 
+def load_baked_sprites():
+    """Load the sprite atlases made by bake_assets.py, keyed by (name, (width, height))"""
+    with open(os.path.join(BAKED_DIR, 'manifest.json')) as manifest_file:
+        manifest = json.load(manifest_file)
+    atlases = {filename: pygame.image.load(os.path.join(BAKED_DIR, filename)) for filename in manifest["atlases"]}
+    return {(sprite["name"], tuple(sprite["size"])): atlases[sprite["atlas"]].subsurface(sprite["rect"])
+            for sprite in manifest["sprites"].values()}
+
+_baked_sprites = None
+
+def load_sprite(name, size):
+    """Get a baked sprite at its final size, falling back to scaling the source image"""
+    global _baked_sprites
+    if _baked_sprites is None:
+        try:
+            _baked_sprites = load_baked_sprites()
+        except (OSError, ValueError, KeyError, pygame.error) as e:
+            print(f"Could not load baked sprites, run bake_assets.py: {e}")
+            _baked_sprites = {}
+    sprite = _baked_sprites.get((name, tuple(size)))
+    if sprite is None:
+        print(f"No baked {name} sprite at {size[0]}x{size[1]}, scaling {name}.png instead")
+        return load_image(f'{name}.png', size)
+    return sprite
+
+def convert_sprite(surface):
+    """Convert a sprite with transparency to the display's pixel format (needs the display mode set).
+    
+    Opaque sprites stay in the 24-bit format of the opaque atlas; SDL copies those
+    onto the display faster than opaque sprites converted to its 32-bit format.
+    """
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface
+
 class MessageSystem:
     """Handles displaying messages to the player"""
-    def __init__(self):
-        self.messages = []  # List of (message, color, duration, position, creation_time)
+    def __init__(self, scheduler):
+        self.scheduler = scheduler  # The game's TimerWheel; messages expire as the game loop updates it
+        self.messages = {}  # Insertion-ordered id -> (message, color, duration, position, creation_time)
+        self.next_id = 0
+        self.changed = False  # Set when a message appears or expires, for render-on-change screens
     
     def add_message(self, message, color=(255, 255, 255), duration=3.0, position='bottom'):
         """Add a message to be displayed"""
-        self.messages.append((message, color, duration, position, time.time()))
+        message_id = self.next_id
+        self.next_id += 1
+        self.messages[message_id] = (message, color, duration, position, self.scheduler.now() / 1000)
+        self.changed = True
+        # Expired messages drop out on their own timer instead of a per-frame list rebuild
+        self.scheduler.schedule(duration * 1000, lambda: self.expire(message_id))
     
-    def update(self):
-        """Update messages, removing expired ones"""
-        current_time = time.time()
-        self.messages = [msg for msg in self.messages 
-                        if current_time - msg[4] < msg[2]]
+    def expire(self, message_id):
+        """Remove a message whose time is up"""
+        del self.messages[message_id]
+        self.changed = True
     
     def draw(self, surface, screen_width, screen_height):
         """Draw all active messages"""
@@ -51,7 +95,7 @@ class MessageSystem:
         center_messages = []
         bottom_messages = []
         
-        for msg, color, _, position, creation_time in self.messages:
+        for msg, color, _, position, creation_time in self.messages.values():
             if position == 'top':
                 top_messages.append((msg, color, creation_time))
             elif position == 'center':
@@ -104,7 +148,7 @@ class MessageSystem:
         self.add_message(f"Final Score: {score}", (255, 215, 0), 5.0, 'center')
         self.add_message("Want to play again? Press R", (255, 255, 255), 5.0, 'center')
 
-def initialize_ui():
+def initialize_ui(scheduler):
     """Initialize UI elements"""
-    message_system = MessageSystem()
+    message_system = MessageSystem(scheduler)
     return message_system